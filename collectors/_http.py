@@ -0,0 +1,45 @@
+from functools import lru_cache
+
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config.settings import CACHE_DIR
+
+# HTTP response caches persisted across runs
+HTTP_CACHE_DIR = CACHE_DIR
+
+# Cache lifetimes by URL pattern; anything else is only cached when the
+# server's Cache-Control headers allow it
+URLS_EXPIRE_AFTER = {
+    # Pages change often, so cached copies are only reused for 10 minutes
+    "*.listennotes.com": 600,
+    # Search results and show episode lists only change every few hours
+    "api.spotify.com": 3600,
+}
+
+POOL_SIZE = 64
+
+
+@lru_cache
+def get_shared_session() -> requests_cache.CachedSession:
+    """Get the HTTP session shared by the requests-based collectors.
+
+    One connection pool serves every collector, with retries and backoff
+    on rate limiting and server errors.
+    """
+    session = requests_cache.CachedSession(
+        str(HTTP_CACHE_DIR / "http"),
+        expire_after=requests_cache.DO_NOT_CACHE,
+        urls_expire_after=URLS_EXPIRE_AFTER,
+        cache_control=True,
+        stale_if_error=True,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=POOL_SIZE,
+        pool_maxsize=POOL_SIZE,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
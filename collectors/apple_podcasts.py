@@ -1,12 +1,20 @@
-from datetime import datetime
-from typing import Optional, List
-from xml.etree import ElementTree
+import asyncio
+import json
+import math
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from itertools import chain, islice
+from typing import Optional, List, Dict, AsyncIterator
+from urllib.parse import urlsplit
 
-import requests
+import aiohttp
+from aiohttp_client_cache import CachedSession, SQLiteBackend
+from lxml import etree
 
 from models import Episode, Source
 from config.settings import Settings
 from .base import BaseCollector
+from ._http import HTTP_CACHE_DIR
 
 
 class ApplePodcastsCollector(BaseCollector):
@@ -29,10 +37,45 @@ class ApplePodcastsCollector(BaseCollector):
     LOOKUP_API = "https://itunes.apple.com/lookup"
     TOP_PODCASTS_API = "https://itunes.apple.com/us/rss/toppodcasts/limit={limit}/genre={genre}/json"
 
+    HEADERS = {"User-Agent": "PodcastNewsletter/1.0"}
+
+    # Concurrency and retry limits for the async fetchers
+    MAX_CONNECTIONS = 256
+    MAX_CONNECTIONS_PER_HOST = 64
+    MAX_RETRIES = 3
+    RETRY_BACKOFF = 0.5  # seconds, doubled on every retry
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    # Charts and lookups are reused for an hour. Feeds bypass the cache: a
+    # cached response has to be read in full before it is returned, which
+    # would defeat streaming only the first few items.
+    CACHE_EXPIRY = 3600
+
+    # Only the newest few items of each feed are used
+    MAX_FEED_ITEMS = 5
+    # Feeds in the wild are often large or slightly malformed
+    FEED_PARSER_OPTIONS = {"huge_tree": True, "recover": True, "resolve_entities": False}
+    FEED_CHUNK_SIZE = 64 * 1024
+
+    # Feed namespace lookups, compiled once and shared by every feed. For
+    # these single-child lookups a compiled XPath also beats find/findtext
+    # with Clark-notation tags in lxml. Results are plain strings so episodes
+    # don't keep a reference to their feed's element tree.
+    FEED_NS = {
+        "itunes": "http://www.itunes.com/dtds/podcast-1.0.dtd",
+        "content": "http://purl.org/rss/1.0/modules/content/",
+    }
+    _AUTHOR_XP = etree.XPath("string(itunes:author)", namespaces=FEED_NS, smart_strings=False)
+    _IMAGE_XP = etree.XPath("string(itunes:image/@href)", namespaces=FEED_NS, smart_strings=False)
+    _DURATION_XP = etree.XPath("string(itunes:duration)", namespaces=FEED_NS, smart_strings=False)
+    _SUMMARY_XP = etree.XPath("string(itunes:summary)", namespaces=FEED_NS, smart_strings=False)
+    # Plain RSS 2.0 fallbacks for feeds without iTunes tags
+    _CONTENT_XP = etree.XPath("string(content:encoded)", namespaces=FEED_NS, smart_strings=False)
+    _RSS_IMAGE_XP = etree.XPath("string(image/url)", smart_strings=False)
+
     def __init__(self, settings: Settings):
         super().__init__(settings)
-        self._session = requests.Session()
-        self._session.headers.update({"User-Agent": "PodcastNewsletter/1.0"})
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
 
     def is_configured(self) -> bool:
         # Apple Podcasts doesn't require API keys
@@ -40,82 +83,164 @@ class ApplePodcastsCollector(BaseCollector):
 
     def collect(self, max_episodes: Optional[int] = None) -> List[Episode]:
         """Collect episodes from Apple Podcasts top charts."""
+        return asyncio.run(self.collect_async(max_episodes))
+
+    async def collect_async(self, max_episodes: Optional[int] = None) -> List[Episode]:
+        """Collect episodes from Apple Podcasts top charts on the running event loop."""
         max_episodes = max_episodes or self.settings.max_episodes_per_source
-        episodes = []
-        seen_podcast_ids = set()
+        return await self._collect_async(max_episodes)
+
+    async def _collect_async(self, max_episodes: int) -> List[Episode]:
+        """Fetch all genre charts, then all podcast feeds, concurrently."""
+        # Semaphores are bound to the running event loop, so start fresh per run
+        self._host_semaphores = {}
 
-        for genre_name, genre_id in self.GENRE_IDS.items():
-            try:
-                top_podcasts = self._get_top_podcasts(genre_id, limit=10)
+        connector = aiohttp.TCPConnector(
+            limit=self.MAX_CONNECTIONS,
+            limit_per_host=self.MAX_CONNECTIONS_PER_HOST,
+        )
+        cache = SQLiteBackend(
+            str(HTTP_CACHE_DIR / "apple_podcasts.sqlite"),
+            expire_after=self.CACHE_EXPIRY,
+            cache_control=True,
+        )
+        feed_connector = aiohttp.TCPConnector(
+            limit=self.MAX_CONNECTIONS,
+            limit_per_host=self.MAX_CONNECTIONS_PER_HOST,
+        )
+        async with CachedSession(cache=cache, connector=connector, headers=self.HEADERS) as session, \
+                aiohttp.ClientSession(connector=feed_connector, headers=self.HEADERS) as feed_session:
+            top_lists = await asyncio.gather(*[
+                self._get_top_podcasts(session, genre_id, limit=10)
+                for genre_id in self.GENRE_IDS.values()
+            ])
+
+            # Keep chart order so the per-genre ranking is preserved
+            podcasts = []
+            seen_podcast_ids = set()
+            for genre_name, top_podcasts in zip(self.GENRE_IDS, top_lists):
                 for podcast in top_podcasts:
                     podcast_id = podcast.get("id", {}).get("attributes", {}).get("im:id")
                     if not podcast_id or podcast_id in seen_podcast_ids:
                         continue
                     seen_podcast_ids.add(podcast_id)
+                    podcasts.append((podcast_id, podcast, genre_name))
+
+            results = await asyncio.gather(*[
+                self._fetch_podcast(session, feed_session, podcast_id, podcast, genre_name)
+                for podcast_id, podcast, genre_name in podcasts
+            ])
 
-                    # Get feed URL and fetch episodes
-                    feed_url = self._get_feed_url(podcast_id)
-                    if feed_url:
-                        podcast_episodes = self._get_episodes_from_feed(feed_url, podcast, genre_name)
-                        episodes.extend(podcast_episodes[:2])  # Top 2 episodes per podcast
+        # Top 2 episodes per podcast
+        episodes = chain.from_iterable(podcast_episodes[:2] for podcast_episodes in results)
+        return list(islice(episodes, max_episodes))
 
-                    if len(episodes) >= max_episodes:
-                        break
-            except Exception as e:
-                self.logger.error(f"Error fetching Apple Podcasts genre {genre_name}: {e}")
+    @asynccontextmanager
+    async def _request(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        params: Optional[dict] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """GET a URL, retrying with exponential backoff on 429/5xx responses.
 
-            if len(episodes) >= max_episodes:
-                break
+        Yields the successful response with its body still unread.
+        """
+        host = urlsplit(url).netloc
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._host_semaphores[host] = asyncio.Semaphore(self.MAX_CONNECTIONS_PER_HOST)
 
-        return episodes[:max_episodes]
+        request_timeout = aiohttp.ClientTimeout(total=timeout) if timeout else None
+        for attempt in range(self.MAX_RETRIES + 1):
+            async with semaphore:
+                async with session.get(url, params=params, timeout=request_timeout) as response:
+                    if response.status not in self.RETRY_STATUSES or attempt == self.MAX_RETRIES:
+                        response.raise_for_status()
+                        yield response
+                        return
+            await asyncio.sleep(self.RETRY_BACKOFF * 2 ** attempt)
 
-    def _get_top_podcasts(self, genre_id: int, limit: int = 10) -> List[dict]:
+    async def _fetch(self, session: CachedSession, url: str, **kwargs) -> bytes:
+        """GET a URL and return its body; see _request for the arguments."""
+        async with self._request(session, url, **kwargs) as response:
+            return await response.read()
+
+    async def _fetch_podcast(
+        self,
+        session: CachedSession,
+        feed_session: aiohttp.ClientSession,
+        podcast_id: str,
+        podcast_info: dict,
+        genre: str,
+    ) -> List[Episode]:
+        """Look up a podcast's feed URL and fetch its episodes."""
+        feed_url = await self._get_feed_url(session, podcast_id)
+        if not feed_url:
+            return []
+        return await self._get_episodes_from_feed(feed_session, feed_url, podcast_info, genre)
+
+    async def _get_top_podcasts(self, session: CachedSession, genre_id: int, limit: int = 10) -> List[dict]:
         """Get top podcasts for a genre from Apple's RSS feed."""
         url = self.TOP_PODCASTS_API.format(limit=limit, genre=genre_id)
         try:
-            response = self._session.get(url)
-            response.raise_for_status()
-            data = response.json()
+            # Apple serves these as text/javascript, so decode the body ourselves
+            data = json.loads(await self._fetch(session, url))
             return data.get("feed", {}).get("entry", [])
         except Exception as e:
             self.logger.error(f"Error fetching top podcasts: {e}")
             return []
 
-    def _get_feed_url(self, podcast_id: str) -> Optional[str]:
+    async def _get_feed_url(self, session: CachedSession, podcast_id: str) -> Optional[str]:
         """Get RSS feed URL for a podcast using iTunes Lookup API."""
         try:
-            response = self._session.get(self.LOOKUP_API, params={"id": podcast_id, "entity": "podcast"})
-            response.raise_for_status()
-            results = response.json().get("results", [])
+            body = await self._fetch(session, self.LOOKUP_API, params={"id": podcast_id, "entity": "podcast"})
+            results = json.loads(body).get("results", [])
             if results:
                 return results[0].get("feedUrl")
         except Exception as e:
             self.logger.error(f"Error looking up podcast {podcast_id}: {e}")
         return None
 
-    def _get_episodes_from_feed(self, feed_url: str, podcast_info: dict, genre: str) -> List[Episode]:
+    async def _get_episodes_from_feed(
+        self,
+        session: aiohttp.ClientSession,
+        feed_url: str,
+        podcast_info: dict,
+        genre: str,
+    ) -> List[Episode]:
         """Parse RSS feed to get episodes."""
         episodes = []
         try:
-            response = self._session.get(feed_url, timeout=10)
-            response.raise_for_status()
-
-            root = ElementTree.fromstring(response.content)
-            channel = root.find("channel")
-            if channel is None:
-                return []
-
-            podcast_title = channel.findtext("title", "Unknown Podcast")
-            podcast_author = channel.findtext("{http://www.itunes.com/dtds/podcast-1.0.dtd}author", "")
-            podcast_image = None
-            image_elem = channel.find("{http://www.itunes.com/dtds/podcast-1.0.dtd}image")
-            if image_elem is not None:
-                podcast_image = image_elem.get("href")
-
-            for item in channel.findall("item")[:5]:
-                episode = self._parse_rss_item(item, podcast_title, podcast_author, podcast_image, genre)
-                if episode:
-                    episodes.append(episode)
+            # Feed the body into a pull parser as it arrives instead of building
+            # the whole tree. Only the first few items are kept, so the response
+            # is closed there without downloading the rest, and earlier items
+            # are freed as we go.
+            parser = etree.XMLPullParser(events=("end",), tag="item", **self.FEED_PARSER_OPTIONS)
+            count = 0
+            async with self._request(session, feed_url, timeout=10) as response:
+                async for chunk in response.content.iter_chunked(self.FEED_CHUNK_SIZE):
+                    parser.feed(chunk)
+                    for _, item in parser.read_events():
+                        if count == 0:
+                            # Channel metadata precedes the items and is complete by now
+                            channel = item.getparent()
+                            podcast_title = channel.findtext("title", "Unknown Podcast")
+                            podcast_author = self._AUTHOR_XP(channel)
+                            podcast_image = self._IMAGE_XP(channel) or self._RSS_IMAGE_XP(channel) or None
+
+                        episode = self._parse_rss_item(item, podcast_title, podcast_author, podcast_image, genre)
+                        if episode:
+                            episodes.append(episode)
+
+                        item.clear()
+                        while item.getprevious() is not None:
+                            del item.getparent()[0]
+
+                        count += 1
+                        if count >= self.MAX_FEED_ITEMS:
+                            return episodes
 
         except Exception as e:
             self.logger.error(f"Error parsing feed {feed_url}: {e}")
@@ -124,7 +249,7 @@ class ApplePodcastsCollector(BaseCollector):
 
     def _parse_rss_item(
         self,
-        item: ElementTree.Element,
+        item: etree._Element,
         podcast_title: str,
         podcast_author: str,
         podcast_image: Optional[str],
@@ -136,20 +261,15 @@ class ApplePodcastsCollector(BaseCollector):
             published_at = None
             pub_date = item.findtext("pubDate")
             if pub_date:
+                # RFC 2822 dates, with numeric offsets or named zones
                 try:
-                    # Handle various date formats
-                    for fmt in ["%a, %d %b %Y %H:%M:%S %z", "%a, %d %b %Y %H:%M:%S %Z"]:
-                        try:
-                            published_at = datetime.strptime(pub_date.strip(), fmt)
-                            break
-                        except ValueError:
-                            continue
-                except Exception:
+                    published_at = parsedate_to_datetime(pub_date.strip())
+                except (TypeError, ValueError):
                     pass
 
             # Get duration
             duration_seconds = None
-            duration_str = item.findtext("{http://www.itunes.com/dtds/podcast-1.0.dtd}duration")
+            duration_str = self._DURATION_XP(item)
             if duration_str:
                 duration_seconds = self._parse_duration(duration_str)
 
@@ -160,21 +280,24 @@ class ApplePodcastsCollector(BaseCollector):
                 audio_url = enclosure.get("url")
 
             # Get episode image or fall back to podcast image
-            image_url = podcast_image
-            ep_image = item.find("{http://www.itunes.com/dtds/podcast-1.0.dtd}image")
-            if ep_image is not None:
-                image_url = ep_image.get("href") or image_url
+            image_url = self._IMAGE_XP(item) or podcast_image
+
+            title = item.findtext("title")
 
             # Generate unique ID from guid or title
-            guid = item.findtext("guid") or item.findtext("title", "")
-            episode_id = f"ap_{hash(guid) % 10**10}"
+            guid = item.findtext("guid") or title or ""
+            episode_id = self._stable_id("ap", guid)
 
             return Episode(
                 id=episode_id,
-                title=item.findtext("title", "Untitled"),
+                title=title if title is not None else "Untitled",
                 podcast_title=podcast_title,
                 podcast_author=podcast_author,
-                description=item.findtext("description", "") or item.findtext("{http://www.itunes.com/dtds/podcast-1.0.dtd}summary", ""),
+                description=(
+                    item.findtext("description", "")
+                    or self._SUMMARY_XP(item)
+                    or self._CONTENT_XP(item)
+                ),
                 published_at=published_at,
                 duration_seconds=duration_seconds,
                 audio_url=audio_url,
@@ -188,14 +311,19 @@ class ApplePodcastsCollector(BaseCollector):
             return None
 
     def _parse_duration(self, duration_str: str) -> Optional[int]:
-        """Parse duration string to seconds."""
+        """Parse duration string ("HH:MM:SS", "MM:SS" or seconds) to seconds."""
         try:
-            parts = duration_str.split(":")
-            if len(parts) == 3:
-                return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
-            elif len(parts) == 2:
-                return int(parts[0]) * 60 + int(parts[1])
-            else:
-                return int(duration_str)
+            parts = duration_str.strip().split(":")
+            if len(parts) > 3:
+                return None
+            # Some feeds append fractional seconds or pad with whitespace
+            seconds = 0.0
+            for part in parts:
+                value = float(part)
+                # float() also accepts "inf", "nan" and negative numbers
+                if not math.isfinite(value) or value < 0:
+                    return None
+                seconds = seconds * 60 + value
+            return int(seconds)
         except (ValueError, TypeError):
             return None
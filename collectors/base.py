@@ -1,3 +1,5 @@
+import asyncio
+import hashlib
 from abc import ABC, abstractmethod
 from typing import Optional, List
 import logging
@@ -35,6 +37,23 @@ class BaseCollector(ABC):
         """
         pass
 
+    async def collect_async(self, max_episodes: Optional[int] = None) -> List[Episode]:
+        """Collect episodes without blocking the event loop.
+
+        Runs the synchronous collect() in a worker thread. Collectors with
+        native async I/O override this.
+        """
+        return await asyncio.to_thread(self.collect, max_episodes)
+
+    @staticmethod
+    def _stable_id(prefix: str, *parts: str) -> str:
+        """Build an episode ID that is stable across runs.
+
+        Unlike the built-in hash(), blake2b is not salted per process.
+        """
+        digest = hashlib.blake2b("|".join(parts).encode("utf-8"), digest_size=8).hexdigest()
+        return f"{prefix}_{digest}"
+
     def safe_collect(self, max_episodes: Optional[int] = None) -> List[Episode]:
         """Safely collect episodes, handling errors gracefully."""
         if not self.is_configured():
@@ -48,3 +67,17 @@ class BaseCollector(ABC):
         except Exception as e:
             self.logger.error(f"Error collecting from {self.source.value}: {e}")
             return []
+
+    async def safe_collect_async(self, max_episodes: Optional[int] = None) -> List[Episode]:
+        """Async variant of safe_collect, for collecting from sources concurrently."""
+        if not self.is_configured():
+            self.logger.warning(f"{self.source.value} collector is not configured, skipping")
+            return []
+
+        try:
+            episodes = await self.collect_async(max_episodes)
+            self.logger.info(f"Collected {len(episodes)} episodes from {self.source.value}")
+            return episodes
+        except Exception as e:
+            self.logger.error(f"Error collecting from {self.source.value}: {e}")
+            return []
@@ -1,12 +1,15 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, List
+from itertools import islice
+from typing import Optional, List, Iterator
 
 import requests
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
 from models import Episode, Source
 from config.settings import Settings
 from .base import BaseCollector
+from ._http import get_shared_session
 
 
 class ListenNotesCollector(BaseCollector):
@@ -26,14 +29,29 @@ class ListenNotesCollector(BaseCollector):
         "science": "/best-science-podcasts",
     }
 
-    def __init__(self, settings: Settings):
+    # CSS selectors for the scraped pages
+    TRENDING_CARD_SELECTOR = ".podcast-card, .ln-card, [class*='podcast']"
+    CATEGORY_CARD_SELECTOR = ".ln-shadow-card, .podcast-card, [class*='podcast-item']"
+    TITLE_SELECTOR = "h2, h3, h4, .title, [class*='title']"
+    PODCAST_NAME_SELECTOR = ".podcast-name, [class*='podcast-name'], .subtitle"
+    DESCRIPTION_SELECTOR = ".description, [class*='description'], p"
+
+    # Cards parsed per page
+    MAX_CARDS_PER_PAGE = 10
+
+    # Enough workers to fetch the trending page and every category page at once
+    MAX_WORKERS = 8
+
+    # Browser-like headers, sent per request since the session is shared
+    HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.5",
+    }
+
+    def __init__(self, settings: Settings, session: Optional[requests.Session] = None):
         super().__init__(settings)
-        self._session = requests.Session()
-        self._session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-        })
+        self._session = session or get_shared_session()
 
     def is_configured(self) -> bool:
         # Web scraping doesn't require API keys
@@ -42,38 +60,44 @@ class ListenNotesCollector(BaseCollector):
     def collect(self, max_episodes: Optional[int] = None) -> List[Episode]:
         """Collect episodes by scraping Listen Notes."""
         max_episodes = max_episodes or self.settings.max_episodes_per_source
-        episodes = []
+        return list(islice(self.iter_episodes(), max_episodes))
 
-        # Try to get trending podcasts first
-        try:
-            trending_episodes = self._scrape_trending()
-            episodes.extend(trending_episodes)
-        except Exception as e:
-            self.logger.error(f"Error scraping trending: {e}")
+    def iter_episodes(self) -> Iterator[Episode]:
+        """Yield episodes from the trending page, then each category page.
 
-        # Then get from category pages
-        for category, path in self.CATEGORY_PAGES.items():
-            if len(episodes) >= max_episodes:
-                break
+        Pages are fetched concurrently but yielded in order.
+        """
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            trending = executor.submit(self._scrape_trending)
+            category_pages = {
+                category: executor.submit(self._scrape_category_page, path, category)
+                for category, path in self.CATEGORY_PAGES.items()
+            }
+
+            # Try to get trending podcasts first
             try:
-                category_episodes = self._scrape_category_page(path, category)
-                episodes.extend(category_episodes)
+                yield from trending.result()
             except Exception as e:
-                self.logger.error(f"Error scraping category {category}: {e}")
+                self.logger.error(f"Error scraping trending: {e}")
 
-        return episodes[:max_episodes]
+            # Then get from category pages
+            for category, future in category_pages.items():
+                try:
+                    yield from future.result()
+                except Exception as e:
+                    self.logger.error(f"Error scraping category {category}: {e}")
 
     def _scrape_trending(self) -> List[Episode]:
         """Scrape trending podcasts from Listen Notes homepage."""
         episodes = []
         try:
-            response = self._session.get(f"{self.BASE_URL}/", timeout=15)
+            response = self._session.get(f"{self.BASE_URL}/", headers=self.HEADERS, timeout=15)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            tree = LexborHTMLParser(response.text)
 
             # Look for podcast cards on the page
-            podcast_cards = soup.select(".podcast-card, .ln-card, [class*='podcast']")[:10]
+            podcast_cards = self._select_cards(tree, self.TRENDING_CARD_SELECTOR, self.MAX_CARDS_PER_PAGE)
 
             for card in podcast_cards:
                 episode = self._parse_podcast_card(card)
@@ -89,13 +113,13 @@ class ListenNotesCollector(BaseCollector):
         """Scrape a category best podcasts page."""
         episodes = []
         try:
-            response = self._session.get(f"{self.BASE_URL}{path}", timeout=15)
+            response = self._session.get(f"{self.BASE_URL}{path}", headers=self.HEADERS, timeout=15)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            tree = LexborHTMLParser(response.text)
 
             # Find podcast entries
-            podcast_entries = soup.select(".ln-shadow-card, .podcast-card, [class*='podcast-item']")[:10]
+            podcast_entries = self._select_cards(tree, self.CATEGORY_CARD_SELECTOR, self.MAX_CARDS_PER_PAGE)
 
             for entry in podcast_entries:
                 episode = self._parse_podcast_card(entry, category)
@@ -107,40 +131,59 @@ class ListenNotesCollector(BaseCollector):
 
         return episodes
 
+    def _select_cards(self, tree: LexborHTMLParser, selector: str, limit: int) -> list:
+        """Select up to limit card nodes in document order, without duplicates.
+
+        Lexbor can return a node once for every selector in a group that it
+        matches, so repeated nodes are dropped here. css() still builds the
+        full match list; only the de-duplication loop stops once limit cards
+        are found.
+        """
+        cards = []
+        seen_ids = set()
+        for node in tree.css(selector):
+            if node.mem_id in seen_ids:
+                continue
+            seen_ids.add(node.mem_id)
+            cards.append(node)
+            if len(cards) == limit:
+                break
+        return cards
+
     def _parse_podcast_card(self, card, category: str = "") -> Optional[Episode]:
         """Parse a podcast card element into Episode model."""
         try:
             # Try various selectors to find title
-            title_elem = card.select_one("h2, h3, h4, .title, [class*='title']")
-            title = title_elem.get_text(strip=True) if title_elem else None
+            title_elem = card.css_first(self.TITLE_SELECTOR)
+            title = title_elem.text(strip=True) if title_elem else None
 
             if not title:
                 return None
 
             # Try to find podcast name
-            podcast_elem = card.select_one(".podcast-name, [class*='podcast-name'], .subtitle")
-            podcast_title = podcast_elem.get_text(strip=True) if podcast_elem else "Unknown Podcast"
+            podcast_elem = card.css_first(self.PODCAST_NAME_SELECTOR)
+            podcast_title = podcast_elem.text(strip=True) if podcast_elem else "Unknown Podcast"
 
             # Try to find description
-            desc_elem = card.select_one(".description, [class*='description'], p")
-            description = desc_elem.get_text(strip=True) if desc_elem else ""
+            desc_elem = card.css_first(self.DESCRIPTION_SELECTOR)
+            description = desc_elem.text(strip=True) if desc_elem else ""
 
             # Try to find link
-            link_elem = card.select_one("a[href]")
+            link_elem = card.css_first("a[href]")
             episode_url = None
             if link_elem:
-                href = link_elem.get("href", "")
+                href = link_elem.attributes.get("href") or ""
                 if href.startswith("/"):
                     episode_url = f"{self.BASE_URL}{href}"
                 elif href.startswith("http"):
                     episode_url = href
 
             # Try to find image
-            img_elem = card.select_one("img")
-            image_url = img_elem.get("src") if img_elem else None
+            img_elem = card.css_first("img")
+            image_url = img_elem.attributes.get("src") if img_elem else None
 
             # Generate unique ID
-            episode_id = f"ln_{hash(title + podcast_title) % 10**10}"
+            episode_id = self._stable_id("ln", title, podcast_title)
 
             return Episode(
                 id=episode_id,
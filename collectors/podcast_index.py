@@ -1,13 +1,17 @@
+import asyncio
 import hashlib
 import time
 from datetime import datetime, timedelta
+from itertools import chain, islice
 from typing import Optional, List
 
-import requests
+import aiohttp
+from aiohttp_client_cache import CachedSession, SQLiteBackend
 
 from models import Episode, Source
 from config.settings import Settings
 from .base import BaseCollector
+from ._http import HTTP_CACHE_DIR
 
 
 class PodcastIndexCollector(BaseCollector):
@@ -15,68 +19,118 @@ class PodcastIndexCollector(BaseCollector):
 
     source = Source.PODCAST_INDEX
     BASE_URL = "https://api.podcastindex.org/api/1.0"
+    MAX_CONNECTIONS_PER_HOST = 64
+    CACHE_EXPIRY = 3600
 
     def __init__(self, settings: Settings):
         super().__init__(settings)
-        self._session = requests.Session()
+        # The signed data always starts with key + secret, so encode that once
+        api_key = settings.podcast_index_api_key or ""
+        api_secret = settings.podcast_index_api_secret or ""
+        self._auth_prefix = (api_key + api_secret).encode("utf-8")
+        # Auth headers only change when the epoch second does
+        self._headers_epoch: Optional[int] = None
+        self._headers: dict = {}
 
     def is_configured(self) -> bool:
         return self.settings.has_podcast_index
 
     def _get_headers(self) -> dict:
-        """Generate authentication headers for Podcast Index API."""
-        api_key = self.settings.podcast_index_api_key
-        api_secret = self.settings.podcast_index_api_secret
+        """Generate authentication headers for Podcast Index API.
 
+        The signature covers the current epoch second, so headers are reused
+        for every request made within the same second.
+        """
         epoch_time = int(time.time())
-        data_to_hash = api_key + api_secret + str(epoch_time)
-        sha1_hash = hashlib.sha1(data_to_hash.encode("utf-8")).hexdigest()
-
-        return {
-            "X-Auth-Date": str(epoch_time),
-            "X-Auth-Key": api_key,
-            "Authorization": sha1_hash,
+        if epoch_time == self._headers_epoch:
+            return self._headers
+
+        epoch_str = str(epoch_time)
+        sha1 = hashlib.sha1(self._auth_prefix)
+        sha1.update(epoch_str.encode("ascii"))
+
+        self._headers_epoch = epoch_time
+        self._headers = {
+            "X-Auth-Date": epoch_str,
+            "X-Auth-Key": self.settings.podcast_index_api_key,
+            "Authorization": sha1.hexdigest(),
             "User-Agent": "PodcastNewsletter/1.0",
         }
-
-    def _make_request(self, endpoint: str, params: Optional[dict] = None) -> dict:
+        return self._headers
+
+    async def _make_request(
+        self,
+        session: CachedSession,
+        endpoint: str,
+        params: Optional[dict] = None,
+    ) -> dict:
         """Make authenticated request to Podcast Index API."""
         url = f"{self.BASE_URL}/{endpoint}"
-        response = self._session.get(url, headers=self._get_headers(), params=params)
-        response.raise_for_status()
-        return response.json()
+        async with session.get(url, headers=self._get_headers(), params=params) as response:
+            response.raise_for_status()
+            return await response.json(content_type=None)
 
     def collect(self, max_episodes: Optional[int] = None) -> List[Episode]:
         """Collect trending and recent episodes from Podcast Index."""
+        return asyncio.run(self.collect_async(max_episodes))
+
+    async def collect_async(self, max_episodes: Optional[int] = None) -> List[Episode]:
+        """Collect trending and recent episodes on the running event loop."""
         max_episodes = max_episodes or self.settings.max_episodes_per_source
-        episodes = []
+        return await self._collect_async(max_episodes)
+
+    async def _collect_async(self, max_episodes: int) -> List[Episode]:
+        """Fetch trending feeds and recent episodes concurrently."""
+        connector = aiohttp.TCPConnector(limit_per_host=self.MAX_CONNECTIONS_PER_HOST)
+        # Auth headers are not part of the cache key, so signed requests still hit
+        cache = SQLiteBackend(
+            str(HTTP_CACHE_DIR / "podcast_index.sqlite"),
+            expire_after=self.CACHE_EXPIRY,
+            cache_control=True,
+        )
+        async with CachedSession(cache=cache, connector=connector) as session:
+            trending_episodes, recent_episodes = await asyncio.gather(
+                self._get_trending_episodes(session),
+                self._get_recent_episodes(session, max_episodes),
+            )
 
-        # Get trending podcasts
+        return list(islice(chain(trending_episodes, recent_episodes), max_episodes))
+
+    async def _get_trending_episodes(self, session: CachedSession) -> List[Episode]:
+        """Get the latest episodes of the trending podcasts."""
+        episodes = []
         try:
-            trending = self._make_request("podcasts/trending", {"max": 20})
-            for feed in trending.get("feeds", [])[:10]:
-                feed_episodes = self._get_episodes_from_feed(feed["id"])
-                episodes.extend(feed_episodes[:3])  # Top 3 episodes per feed
+            trending = await self._make_request(session, "podcasts/trending", {"max": 20})
+            feed_episodes = await asyncio.gather(*[
+                self._get_episodes_from_feed(session, feed["id"])
+                for feed in trending.get("feeds", [])[:10]
+            ])
+            for items in feed_episodes:
+                episodes.extend(items[:3])  # Top 3 episodes per feed
         except Exception as e:
             self.logger.error(f"Error fetching trending: {e}")
+        return episodes
 
-        # Get recent episodes
+    async def _get_recent_episodes(self, session: CachedSession, max_episodes: int) -> List[Episode]:
+        """Get episodes published within the look-back window."""
+        episodes = []
         try:
             since = int((datetime.now() - timedelta(days=self.settings.days_to_look_back)).timestamp())
-            recent = self._make_request("recent/episodes", {"since": since, "max": max_episodes})
+            # Round down to the cache window so repeated runs reuse the response
+            since -= since % self.CACHE_EXPIRY
+            recent = await self._make_request(session, "recent/episodes", {"since": since, "max": max_episodes})
             for item in recent.get("items", []):
                 episode = self._parse_episode(item)
                 if episode:
                     episodes.append(episode)
         except Exception as e:
             self.logger.error(f"Error fetching recent episodes: {e}")
+        return episodes
 
-        return episodes[:max_episodes]
-
-    def _get_episodes_from_feed(self, feed_id: int) -> List[Episode]:
+    async def _get_episodes_from_feed(self, session: CachedSession, feed_id: int) -> List[Episode]:
         """Get episodes from a specific podcast feed."""
         try:
-            response = self._make_request("episodes/byfeedid", {"id": feed_id, "max": 5})
+            response = await self._make_request(session, "episodes/byfeedid", {"id": feed_id, "max": 5})
             episodes = []
             for item in response.get("items", []):
                 episode = self._parse_episode(item)
@@ -106,7 +160,7 @@ class PodcastIndexCollector(BaseCollector):
                 episode_url=item.get("link"),
                 image_url=item.get("feedImage") or item.get("image"),
                 source=self.source,
-                source_categories=item.get("categories", {}).values() if isinstance(item.get("categories"), dict) else [],
+                source_categories=list(item["categories"].values()) if isinstance(item.get("categories"), dict) else [],
             )
         except Exception as e:
             self.logger.error(f"Error parsing episode: {e}")
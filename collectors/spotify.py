@@ -1,12 +1,16 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional, List
 
+import requests
 import spotipy
+from spotipy.cache_handler import CacheFileHandler
 from spotipy.oauth2 import SpotifyClientCredentials
 
 from models import Episode, Source
 from config.settings import Settings
 from .base import BaseCollector
+from ._http import get_shared_session, HTTP_CACHE_DIR
 
 
 class SpotifyCollector(BaseCollector):
@@ -26,8 +30,13 @@ class SpotifyCollector(BaseCollector):
         "fitness workout podcast",
     ]
 
-    def __init__(self, settings: Settings):
+    # Thread pool sizes for the search and episode fetch phases
+    SEARCH_WORKERS = 8
+    EPISODE_WORKERS = 16
+
+    def __init__(self, settings: Settings, session: Optional[requests.Session] = None):
         super().__init__(settings)
+        self._session = session or get_shared_session()
         self._client: Optional[spotipy.Spotify] = None
 
     def is_configured(self) -> bool:
@@ -36,44 +45,60 @@ class SpotifyCollector(BaseCollector):
     def _get_client(self) -> spotipy.Spotify:
         """Get or create Spotify client."""
         if self._client is None:
+            # Persist the access token so later runs reuse it until it expires
+            HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
             auth_manager = SpotifyClientCredentials(
                 client_id=self.settings.spotify_client_id,
                 client_secret=self.settings.spotify_client_secret,
+                cache_handler=CacheFileHandler(cache_path=str(HTTP_CACHE_DIR / "spotify_token.json")),
+                requests_session=self._session,
             )
-            self._client = spotipy.Spotify(auth_manager=auth_manager)
+            self._client = spotipy.Spotify(auth_manager=auth_manager, requests_session=self._session)
         return self._client
 
     def collect(self, max_episodes: Optional[int] = None) -> List[Episode]:
         """Collect episodes by searching Spotify for popular podcasts."""
         max_episodes = max_episodes or self.settings.max_episodes_per_source
-        episodes = []
-        seen_show_ids = set()
-
         client = self._get_client()
 
-        for query in self.SEARCH_QUERIES:
-            try:
-                # Search for shows
-                results = client.search(q=query, type="show", limit=5, market="US")
-                for show in results.get("shows", {}).get("items", []):
-                    if not show or show["id"] in seen_show_ids:
-                        continue
-                    seen_show_ids.add(show["id"])
-
-                    # Get recent episodes from this show
-                    show_episodes = self._get_show_episodes(client, show)
-                    episodes.extend(show_episodes)
+        # Run all searches concurrently; spotipy blocks on I/O, not the GIL
+        with ThreadPoolExecutor(max_workers=self.SEARCH_WORKERS) as executor:
+            search_results = list(executor.map(lambda query: self._search_shows(client, query), self.SEARCH_QUERIES))
 
-                    if len(episodes) >= max_episodes:
-                        break
-            except Exception as e:
-                self.logger.error(f"Error searching Spotify for '{query}': {e}")
-
-            if len(episodes) >= max_episodes:
-                break
+        # De-duplicate in query order so the result doesn't depend on timing
+        shows = []
+        seen_show_ids = set()
+        for results in search_results:
+            for show in results:
+                if not show or show["id"] in seen_show_ids:
+                    continue
+                seen_show_ids.add(show["id"])
+                shows.append(show)
+
+        # Fetch episodes for all shows concurrently, but consume them in show
+        # order and stop once that prefix has enough, so the result is the same
+        # regardless of which requests finish first
+        episodes: List[Episode] = []
+        with ThreadPoolExecutor(max_workers=self.EPISODE_WORKERS) as executor:
+            futures = [executor.submit(self._get_show_episodes, client, show) for show in shows]
+            for future in futures:
+                episodes.extend(future.result())
+                if len(episodes) >= max_episodes:
+                    for pending in futures:
+                        pending.cancel()
+                    break
 
         return episodes[:max_episodes]
 
+    def _search_shows(self, client: spotipy.Spotify, query: str) -> List[dict]:
+        """Search Spotify for shows matching a query."""
+        try:
+            results = client.search(q=query, type="show", limit=5, market="US")
+            return results.get("shows", {}).get("items", [])
+        except Exception as e:
+            self.logger.error(f"Error searching Spotify for '{query}': {e}")
+            return []
+
     def _get_show_episodes(self, client: spotipy.Spotify, show: dict) -> List[Episode]:
         """Get recent episodes from a Spotify show."""
         episodes = []
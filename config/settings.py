@@ -1,7 +1,13 @@
 from functools import lru_cache
-from typing import Optional
+from pathlib import Path
+from typing import Optional, Dict, List, Set, Tuple, Iterator
+
+import ahocorasick
 from pydantic import BaseSettings
 
+# On-disk caches (HTTP responses, categorizations) persisted across runs
+CACHE_DIR = Path(__file__).parent.parent / ".cache"
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -89,6 +95,57 @@ CATEGORY_KEYWORDS = {
 }
 
 
+def _build_keyword_automaton() -> ahocorasick.Automaton:
+    """Compile all category keywords into a single Aho-Corasick automaton.
+
+    Each keyword maps to the categories that list it, so one scan over a
+    text finds every keyword of every category.
+    """
+    keyword_categories: Dict[str, List[str]] = {}
+    for category, keywords in CATEGORY_KEYWORDS.items():
+        for keyword in keywords:
+            categories = keyword_categories.setdefault(keyword.lower(), [])
+            if category not in categories:
+                categories.append(category)
+
+    automaton = ahocorasick.Automaton()
+    for keyword, categories in keyword_categories.items():
+        automaton.add_word(keyword, (tuple(categories), keyword, len(keyword)))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+def iter_keyword_matches(text: str) -> Iterator[Tuple[str, str]]:
+    """Yield (category, keyword) for each whole-word keyword found in text.
+
+    The text must already be lowercased.
+    """
+    last = len(text) - 1
+    for end, (categories, keyword, length) in _KEYWORD_AUTOMATON.iter(text):
+        start = end - length + 1
+        # Same semantics as a \b...\b regex around the keyword. Most raw hits
+        # are short keywords inside longer words ("ai" in "said"), so this
+        # check is the hot path and is kept inline.
+        if start > 0:
+            char = text[start - 1]
+            if char.isalnum() or char == "_":
+                continue
+        if end < last:
+            char = text[end + 1]
+            if char.isalnum() or char == "_":
+                continue
+        for category in categories:
+            yield category, keyword
+
+
+def match_categories(text: str) -> Set[str]:
+    """Return the keys of all categories with a keyword in the text."""
+    return {category for category, _ in iter_keyword_matches(text.lower())}
+
+
 @lru_cache
 def get_settings() -> Settings:
     """Get cached settings instance."""
@@ -14,8 +14,10 @@ Usage:
 """
 
 import argparse
+import asyncio
 import logging
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 
@@ -32,8 +34,9 @@ from collectors import (
 )
 from processors import normalize_episodes, deduplicate_episodes, categorize_episodes
 from processors.categorizer import group_by_category
-from output import generate_newsletter, send_newsletter, archive_newsletter
+from output import send_newsletter, archive_newsletter
 from output.email_sender import send_test_email
+from output.markdown_generator import CATEGORY_NAMES
 
 # Configure logging
 logging.basicConfig(
@@ -43,10 +46,8 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def collect_episodes(settings) -> list:
-    """Collect episodes from all configured sources."""
-    logger.info("Starting episode collection...")
-
+async def collect_all(settings) -> list:
+    """Collect episodes from all configured sources concurrently."""
     collectors = [
         PodcastIndexCollector(settings),
         SpotifyCollector(settings),
@@ -54,13 +55,31 @@ def collect_episodes(settings) -> list:
         ListenNotesCollector(settings),
     ]
 
+    results = await asyncio.gather(
+        *[collector.safe_collect_async() for collector in collectors],
+        return_exceptions=True,
+    )
+
     all_episodes = []
-    for collector in collectors:
-        episodes = collector.safe_collect()
+    for collector, episodes in zip(collectors, results):
+        if isinstance(episodes, BaseException):
+            logger.error(f"  {collector.source.value}: {episodes}")
+            continue
         all_episodes.extend(episodes)
         logger.info(f"  {collector.source.value}: {len(episodes)} episodes")
 
-    logger.info(f"Total collected: {len(all_episodes)} episodes")
+    return all_episodes
+
+
+def collect_episodes(settings) -> list:
+    """Collect episodes from all configured sources."""
+    logger.info("Starting episode collection...")
+
+    start = time.perf_counter()
+    all_episodes = asyncio.run(collect_all(settings))
+    elapsed = time.perf_counter() - start
+
+    logger.info(f"Total collected: {len(all_episodes)} episodes in {elapsed:.1f}s")
     return all_episodes
 
 
@@ -87,19 +106,18 @@ def create_newsletter(episodes: list, settings) -> Newsletter:
     """Create a newsletter from processed episodes."""
     logger.info("Creating newsletter...")
 
-    newsletter = Newsletter(date=datetime.now())
-
     # Group by category and limit per category
     grouped = group_by_category(episodes)
-
-    for category, cat_episodes in grouped.items():
-        # Limit episodes per category
-        limited = cat_episodes[:settings.max_episodes_per_category]
-        for episode in limited:
-            newsletter.add_episode(episode)
-
-    # Generate markdown content
-    newsletter.markdown_content = generate_newsletter(newsletter)
+    episodes_by_category = {
+        category: cat_episodes[:settings.max_episodes_per_category]
+        for category, cat_episodes in grouped.items()
+    }
+
+    newsletter = Newsletter(
+        date=datetime.now(),
+        episodes_by_category=episodes_by_category,
+        total_episodes=sum(map(len, episodes_by_category.values())),
+    )
 
     logger.info(f"Newsletter created with {newsletter.total_episodes} episodes")
     return newsletter
@@ -222,10 +240,8 @@ def main():
         print(f"Date: {newsletter.date.strftime('%B %d, %Y')}")
         print(f"Total episodes: {newsletter.total_episodes}")
         print("\nEpisodes by category:")
-        for category in newsletter.episodes_by_category:
-            count = len(newsletter.episodes_by_category[category])
-            from output.markdown_generator import CATEGORY_NAMES
-            print(f"  {CATEGORY_NAMES[category]}: {count}")
+        for category, cat_episodes in newsletter.episodes_by_category.items():
+            print(f"  {CATEGORY_NAMES[category]}: {len(cat_episodes)}")
 
         return 0
 
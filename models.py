@@ -1,7 +1,7 @@
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Optional, List, Dict
-from pydantic import BaseModel, Field
 
 
 class Category(str, Enum):
@@ -24,7 +24,8 @@ class Source(str, Enum):
     LISTEN_NOTES = "listen_notes"
 
 
-class Podcast(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Podcast:
     """Represents a podcast show."""
     id: str
     title: str
@@ -33,11 +34,12 @@ class Podcast(BaseModel):
     image_url: Optional[str] = None
     feed_url: Optional[str] = None
     website_url: Optional[str] = None
-    categories: List[str] = Field(default_factory=list)
+    categories: List[str] = field(default_factory=list)
     source: Source
 
 
-class Episode(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Episode:
     """Represents a podcast episode."""
     id: str
     title: str
@@ -51,7 +53,7 @@ class Episode(BaseModel):
     episode_url: Optional[str] = None
     image_url: Optional[str] = None
     source: Source
-    source_categories: List[str] = Field(default_factory=list)
+    source_categories: List[str] = field(default_factory=list)
     matched_category: Category = Category.UNCATEGORIZED
 
     @property
@@ -65,17 +67,40 @@ class Episode(BaseModel):
             return f"{hours}:{minutes:02d}:{seconds:02d}"
         return f"{minutes}:{seconds:02d}"
 
-    class Config:
-        # Allow mutation for updating matched_category
-        allow_mutation = True
 
-
-class Newsletter(BaseModel):
+@dataclass(slots=True)
+class Newsletter:
     """Represents a generated newsletter."""
     date: datetime
-    episodes_by_category: Dict[Category, List[Episode]] = Field(default_factory=dict)
+    episodes_by_category: Dict[Category, List[Episode]] = field(default_factory=dict)
     total_episodes: int = 0
-    markdown_content: Optional[str] = None
+    # Rendered output, filled in lazily by the properties below
+    _markdown_content: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _html_content: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def markdown_content(self) -> str:
+        """Markdown rendering of the newsletter, generated on first access."""
+        if self._markdown_content is None:
+            from output.markdown_generator import generate_newsletter
+            self._markdown_content = generate_newsletter(self)
+        return self._markdown_content
+
+    @markdown_content.setter
+    def markdown_content(self, value: Optional[str]) -> None:
+        self._markdown_content = value
+
+    @property
+    def html_content(self) -> str:
+        """Email HTML rendering of the newsletter, generated on first access."""
+        if self._html_content is None:
+            from output.markdown_generator import generate_email_html
+            self._html_content = generate_email_html(self)
+        return self._html_content
+
+    @html_content.setter
+    def html_content(self, value: Optional[str]) -> None:
+        self._html_content = value
 
     def add_episode(self, episode: Episode) -> None:
         """Add an episode to the appropriate category."""
@@ -84,7 +109,6 @@ class Newsletter(BaseModel):
             self.episodes_by_category[category] = []
         self.episodes_by_category[category].append(episode)
         self.total_episodes += 1
-
-    class Config:
-        # Allow mutation for add_episode
-        allow_mutation = True
+        # Any earlier rendering is now out of date
+        self._markdown_content = None
+        self._html_content = None
@@ -3,8 +3,9 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 
-from models import Newsletter
-from .markdown_generator import generate_newsletter
+import orjson
+
+from models import Episode, Newsletter
 
 logger = logging.getLogger(__name__)
 
@@ -33,17 +34,22 @@ def archive_newsletter(
     filename = f"newsletter_{date_str}.md"
     filepath = archive_dir / filename
 
-    # Generate markdown content if not already done
-    if not newsletter.markdown_content:
-        newsletter.markdown_content = generate_newsletter(newsletter)
-
-    # Write to file
+    # Write to file, rendering the markdown only if not already done
     filepath.write_text(newsletter.markdown_content, encoding="utf-8")
     logger.info(f"Newsletter archived to: {filepath}")
 
     return filepath
 
 
+def dump_episodes(episodes: List[Episode], path: Path) -> None:
+    """Write episodes to a JSON file.
+
+    orjson serializes the dataclasses, enums and datetimes natively, without
+    building intermediate dicts.
+    """
+    path.write_bytes(orjson.dumps(episodes))
+
+
 def get_archived_newsletters(archive_dir: Path = ARCHIVE_DIR) -> List[Path]:
     """Get list of archived newsletter files.
 
@@ -5,7 +5,6 @@ import resend
 
 from models import Newsletter
 from config.settings import Settings
-from .markdown_generator import generate_email_html
 
 logger = logging.getLogger(__name__)
 
@@ -37,17 +36,16 @@ def send_newsletter(
     # Initialize Resend
     resend.api_key = settings.resend_api_key
 
-    # Generate email content
+    # Email content is rendered once and reused by later sends
     date_str = newsletter.date.strftime("%B %d, %Y")
     subject = f"Podcast Inspiration - {date_str}"
-    html_content = generate_email_html(newsletter)
 
     try:
         params = {
             "from": "Podcast Inspiration <onboarding@resend.dev>",
             "to": [to_email],
             "subject": subject,
-            "html": html_content,
+            "html": newsletter.html_content,
         }
 
         response = resend.Emails.send(params)
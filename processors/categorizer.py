@@ -1,9 +1,50 @@
-import re
-from collections import Counter
+import hashlib
+import logging
+from datetime import datetime
 from typing import List, Dict
 
+import orjson
+
 from models import Episode, Category
-from config.settings import CATEGORY_KEYWORDS
+from config.settings import CACHE_DIR, CATEGORY_KEYWORDS, iter_keyword_matches
+
+logger = logging.getLogger(__name__)
+
+# Categorizations persisted between runs, keyed by episode content hash.
+# Loading and saving cost grows with the file, so it only holds about the
+# last few runs' worth of episodes.
+CATEGORY_CACHE_PATH = CACHE_DIR / "categorize.json"
+MAX_CACHE_ENTRIES = 1_000
+
+# Sorts episodes without a publish date last
+_UNKNOWN_PUBLISHED_AT = datetime(1970, 1, 1)
+
+_CATEGORY_MAP = {
+    "tech_startups": Category.TECH_STARTUPS,
+    "business_finance": Category.BUSINESS_FINANCE,
+    "news_current_events": Category.NEWS_CURRENT_EVENTS,
+    "philosophy": Category.PHILOSOPHY,
+    "lifestyle_personal_growth": Category.LIFESTYLE_PERSONAL_GROWTH,
+    "career_development": Category.CAREER_DEVELOPMENT,
+    "health_longevity": Category.HEALTH_LONGEVITY,
+    "fitness_weight_training": Category.FITNESS_WEIGHT_TRAINING,
+    "sleep_management": Category.SLEEP_MANAGEMENT,
+}
+
+_CATEGORIES_BY_VALUE = {category.value: category for category in Category}
+
+# Cached results are only valid for the keywords and category mapping that
+# produced them
+_CACHE_FINGERPRINT = hashlib.blake2b(
+    orjson.dumps(
+        {
+            "keywords": CATEGORY_KEYWORDS,
+            "categories": {key: category.value for key, category in _CATEGORY_MAP.items()},
+        },
+        option=orjson.OPT_SORT_KEYS,
+    ),
+    digest_size=8,
+).hexdigest()
 
 
 def categorize_episodes(episodes: List[Episode]) -> List[Episode]:
@@ -11,59 +52,97 @@ def categorize_episodes(episodes: List[Episode]) -> List[Episode]:
 
     Assigns each episode to the most relevant category based on
     keyword matching in title, description, and source categories.
+    Episodes are updated in place and the same list is returned.
     """
-    categorized = []
+    cache = _load_category_cache()
 
     for episode in episodes:
-        category = _match_category(episode)
-        # Create a copy with the matched category
-        categorized_episode = episode.copy(update={"matched_category": category})
-        categorized.append(categorized_episode)
+        key = _content_key(episode)
+        cached = cache.pop(key, None)
+        # Values that are no longer Category members count as misses
+        category = _CATEGORIES_BY_VALUE.get(cached) if isinstance(cached, str) else None
+        if category is None:
+            category = _match_category(episode)
+        # Re-insert so the most recently used entries are kept when trimming
+        cache[key] = category.value
+        # Episodes are mutable dataclasses, so set the category in place
+        episode.matched_category = category
+
+    if episodes:
+        _save_category_cache(cache)
+
+    return episodes
+
+
+def _content_key(episode: Episode) -> str:
+    """Hash the fields that categorization depends on."""
+    content = "|".join([
+        episode.title,
+        episode.description or "",
+        episode.podcast_title,
+        ",".join(episode.source_categories),
+    ])
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=8).hexdigest()
 
-    return categorized
+
+def _load_category_cache() -> Dict[str, str]:
+    """Load cached categorizations, discarding them if the keywords changed.
+
+    A file that can't be read or isn't in the expected format is ignored.
+    """
+    try:
+        data = orjson.loads(CATEGORY_CACHE_PATH.read_bytes())
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable category cache: {e}")
+        return {}
+
+    if not isinstance(data, dict) or data.get("keywords") != _CACHE_FINGERPRINT:
+        return {}
+    categories = data.get("categories")
+    return categories if isinstance(categories, dict) else {}
+
+
+def _save_category_cache(cache: Dict[str, str]) -> None:
+    """Persist categorizations, dropping the least recently used overflow."""
+    if len(cache) > MAX_CACHE_ENTRIES:
+        cache = dict(list(cache.items())[-MAX_CACHE_ENTRIES:])
+
+    try:
+        CATEGORY_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        CATEGORY_CACHE_PATH.write_bytes(
+            orjson.dumps({"keywords": _CACHE_FINGERPRINT, "categories": cache})
+        )
+    except OSError as e:
+        logger.warning(f"Could not write category cache: {e}")
 
 
 def _match_category(episode: Episode) -> Category:
     """Match an episode to the best category."""
-    # Combine text for matching
+    # Combine text for matching, lowercasing it in a single pass
     text_to_match = " ".join([
-        episode.title.lower(),
-        (episode.description or "").lower(),
-        episode.podcast_title.lower(),
-        " ".join(episode.source_categories).lower(),
-    ])
+        episode.title,
+        episode.description or "",
+        episode.podcast_title,
+        *episode.source_categories,
+    ]).lower()
 
-    # Score each category
-    scores: Counter = Counter()
+    # Score each category, seeded in CATEGORY_KEYWORDS order
+    scores = dict.fromkeys(CATEGORY_KEYWORDS, 0)
 
-    for category_key, keywords in CATEGORY_KEYWORDS.items():
-        for keyword in keywords:
-            # Use word boundary matching for better accuracy
-            pattern = rf"\b{re.escape(keyword)}\b"
-            matches = len(re.findall(pattern, text_to_match, re.IGNORECASE))
-            if matches:
-                scores[category_key] += matches
+    # Single pass over the text finds every keyword of every category
+    for category_key, _ in iter_keyword_matches(text_to_match):
+        scores[category_key] += 1
 
-    if not scores:
-        return Category.UNCATEGORIZED
-
-    # Get the category with highest score
-    best_category = scores.most_common(1)[0][0]
+    # Get the category with highest score; ties go to the one listed first
+    best_category, best_score = None, 0
+    for category_key, score in scores.items():
+        if score > best_score:
+            best_category, best_score = category_key, score
 
     # Map to Category enum
-    category_map = {
-        "tech_startups": Category.TECH_STARTUPS,
-        "business_finance": Category.BUSINESS_FINANCE,
-        "news_current_events": Category.NEWS_CURRENT_EVENTS,
-        "philosophy": Category.PHILOSOPHY,
-        "lifestyle_personal_growth": Category.LIFESTYLE_PERSONAL_GROWTH,
-        "career_development": Category.CAREER_DEVELOPMENT,
-        "health_longevity": Category.HEALTH_LONGEVITY,
-        "fitness_weight_training": Category.FITNESS_WEIGHT_TRAINING,
-        "sleep_management": Category.SLEEP_MANAGEMENT,
-    }
-
-    return category_map.get(best_category, Category.UNCATEGORIZED)
+    return _CATEGORY_MAP.get(best_category, Category.UNCATEGORIZED)
 
 
 def group_by_category(episodes: List[Episode]) -> Dict[Category, List[Episode]]:
@@ -81,13 +160,17 @@ def group_by_category(episodes: List[Episode]) -> Dict[Category, List[Episode]]:
         groups[category].append(episode)
 
     # Sort episodes within each category by published date (newest first)
-    # Use timestamp for comparison to avoid timezone-aware vs naive comparison issues
-    from datetime import datetime
-    default_time = datetime(1970, 1, 1)
-    for category in groups:
-        groups[category].sort(
-            key=lambda ep: (ep.published_at.replace(tzinfo=None) if ep.published_at else default_time),
-            reverse=True
-        )
+    for category_episodes in groups.values():
+        category_episodes.sort(key=_published_sort_key, reverse=True)
 
     return groups
+
+
+def _published_sort_key(episode: Episode) -> datetime:
+    """Sort key for an episode's publish date, computed once per episode.
+
+    Drops the timezone to avoid timezone-aware vs naive comparison issues.
+    """
+    if episode.published_at:
+        return episode.published_at.replace(tzinfo=None)
+    return _UNKNOWN_PUBLISHED_AT
@@ -1,9 +1,37 @@
 import re
 from collections import defaultdict
-from typing import List, Dict
+from typing import List, Dict, FrozenSet, Iterable, Optional, Tuple
+
+from datasketch import MinHash, MinHashLSH
 
 from models import Episode, Source
 
+# Titles of the same podcast whose word sets overlap at least this much
+# (Jaccard similarity) are treated as the same episode
+NEAR_DUPLICATE_THRESHOLD = 0.85
+MINHASH_PERMUTATIONS = 64
+# Podcasts with fewer groups than this are compared exactly instead
+LSH_MIN_GROUPS = 64
+
+# Generating the random permutations is most of the cost of a MinHash, so
+# every signature reuses this template's
+_MINHASH_TEMPLATE = MinHash(num_perm=MINHASH_PERMUTATIONS)
+
+# MinHashLSH derives its band/row split by numerical integration, which is
+# far slower than the deduplication itself, so do it once at import
+_LSH_TEMPLATE = MinHashLSH(threshold=NEAR_DUPLICATE_THRESHOLD, num_perm=MINHASH_PERMUTATIONS)
+_LSH_PARAMS = (_LSH_TEMPLATE.b, _LSH_TEMPLATE.r)
+
+_PREFIX_RE = re.compile(r"^(the|a|an)\s+")
+_SUFFIX_RE = re.compile(r"\s*(podcast|show|episode|ep\.?|#\d+).*$")
+_SPECIAL_CHARS_RE = re.compile(r"[^\w\s]")
+
+# For ASCII text, deleting the characters [^\w\s] matches via str.translate
+# is equivalent to the regex and much cheaper
+_SPECIAL_CHARS_TABLE = str.maketrans(
+    "", "", "".join(c for c in map(chr, range(128)) if _SPECIAL_CHARS_RE.match(c))
+)
+
 
 def deduplicate_episodes(episodes: List[Episode]) -> List[Episode]:
     """Remove duplicate episodes across different sources.
@@ -14,9 +42,18 @@ def deduplicate_episodes(episodes: List[Episode]) -> List[Episode]:
     """
     # Group by normalized podcast+episode title
     groups: Dict[str, List[Episode]] = defaultdict(list)
+    # Exact title/podcast matches resolve to the same group without
+    # rebuilding the fuzzy key
+    exact_seen: Dict[Tuple[str, str], str] = {}
+    # Near-duplicate titles (reordered or extra words) of the same podcast,
+    # found by exact comparison or MinHash LSH for podcasts with many groups
+    near_duplicates = _NearDuplicateIndex()
 
     for episode in episodes:
-        key = _get_dedup_key(episode)
+        exact_key = (episode.title.lower().strip(), episode.podcast_title.lower().strip())
+        key = exact_seen.get(exact_key)
+        if key is None:
+            key = exact_seen[exact_key] = _find_group_key(episode, groups, near_duplicates)
         groups[key].append(episode)
 
     # Pick the best episode from each group
@@ -28,13 +65,98 @@ def deduplicate_episodes(episodes: List[Episode]) -> List[Episode]:
     return deduplicated
 
 
-def _get_dedup_key(episode: Episode) -> str:
-    """Generate a normalized key for deduplication."""
-    podcast = _normalize_for_matching(episode.podcast_title)
+def _find_group_key(
+    episode: Episode,
+    groups: Dict[str, List[Episode]],
+    near_duplicates: "_NearDuplicateIndex",
+) -> str:
+    """Find the group an episode belongs to, registering a new one if needed."""
+    podcast = _normalize_for_matching(episode.podcast_title)[:30]
     title = _normalize_for_matching(episode.title)
 
     # Create a key that's resilient to minor differences
-    return f"{podcast[:30]}|{title[:50]}"
+    key = f"{podcast}|{title[:50]}"
+    if key in groups:
+        return key
+
+    words = frozenset(title.split())
+    if not words:
+        return key
+
+    return near_duplicates.match_or_add(key, podcast, words)
+
+
+class _NearDuplicateIndex:
+    """Finds groups whose title is a near-duplicate of a new one.
+
+    Only titles of the same podcast can match, so groups are kept per
+    podcast. A podcast with few groups is compared exactly, which is far
+    cheaper than building MinHash signatures; once it has
+    LSH_MIN_GROUPS groups its titles move into a MinHash LSH index.
+    """
+
+    def __init__(self):
+        # Insertion order and title words of each group
+        self._entries: Dict[str, Tuple[int, FrozenSet[str]]] = {}
+        self._keys_by_podcast: Dict[str, List[str]] = {}
+        self._lsh_by_podcast: Dict[str, MinHashLSH] = {}
+
+    def match_or_add(self, key: str, podcast: str, words: FrozenSet[str]) -> str:
+        """Return the key of a near-duplicate group, or register key as a new one."""
+        keys = self._keys_by_podcast.setdefault(podcast, [])
+        lsh = self._lsh_by_podcast.get(podcast)
+        if lsh is None:
+            minhash = None
+            match = self._best_match(keys, words)
+        else:
+            minhash = _minhash(words)
+            match = self._best_match(lsh.query(minhash), words)
+        if match is not None:
+            return match
+
+        self._entries[key] = (len(self._entries), words)
+        keys.append(key)
+        if lsh is not None:
+            lsh.insert(key, minhash)
+        elif len(keys) >= LSH_MIN_GROUPS:
+            lsh = self._lsh_by_podcast[podcast] = MinHashLSH(
+                num_perm=MINHASH_PERMUTATIONS, params=_LSH_PARAMS
+            )
+            for group_key in keys:
+                lsh.insert(group_key, _minhash(self._entries[group_key][1]))
+        return key
+
+    def _best_match(self, candidates: Iterable[str], words: FrozenSet[str]) -> Optional[str]:
+        # LSH candidates are approximate, so confirm with the exact Jaccard.
+        # An LSH query returns an unordered set; pick the most similar group,
+        # and the earliest one on ties, so the result doesn't depend on hash
+        # seeding.
+        best_key, best_rank = None, None
+        for candidate in candidates:
+            order, candidate_words = self._entries[candidate]
+            similarity = _jaccard(words, candidate_words)
+            if similarity < NEAR_DUPLICATE_THRESHOLD:
+                continue
+            rank = (similarity, -order)
+            if best_rank is None or rank > best_rank:
+                best_key, best_rank = candidate, rank
+        return best_key
+
+
+def _minhash(words: FrozenSet[str]) -> MinHash:
+    """MinHash signature of a word set, reusing the template's permutations."""
+    minhash = MinHash(
+        num_perm=MINHASH_PERMUTATIONS,
+        permutations=_MINHASH_TEMPLATE.permutations,
+        scheme=_MINHASH_TEMPLATE.scheme,
+    )
+    minhash.update_batch([word.encode("utf-8") for word in sorted(words)])
+    return minhash
+
+
+def _jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Jaccard similarity of two word sets."""
+    return len(a & b) / len(a | b)
 
 
 def _normalize_for_matching(text: str) -> str:
@@ -42,16 +164,17 @@ def _normalize_for_matching(text: str) -> str:
     text = text.lower()
 
     # Remove common podcast prefixes/suffixes
-    text = re.sub(r"^(the|a|an)\s+", "", text)
-    text = re.sub(r"\s*(podcast|show|episode|ep\.?|#\d+).*$", "", text)
+    text = _PREFIX_RE.sub("", text)
+    text = _SUFFIX_RE.sub("", text)
 
     # Remove special characters
-    text = re.sub(r"[^\w\s]", "", text)
+    if text.isascii():
+        text = text.translate(_SPECIAL_CHARS_TABLE)
+    else:
+        text = _SPECIAL_CHARS_RE.sub("", text)
 
     # Remove extra whitespace
-    text = re.sub(r"\s+", " ", text).strip()
-
-    return text
+    return " ".join(text.split())
 
 
 def _pick_best_episode(episodes: List[Episode]) -> Episode:
@@ -1,9 +1,17 @@
 import html
 import re
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional, List
 
 from models import Episode
 
+# Below this many episodes, process start-up costs more than it saves
+PARALLEL_THRESHOLD = 500
+PARALLEL_CHUNK_SIZE = 64
+
+# Any run of HTML tags and whitespace collapses to a single space
+_CLEAN_RE = re.compile(r"(?:<[^>]+>|\s)+")
+
 
 def normalize_episodes(episodes: List[Episode]) -> List[Episode]:
     """Normalize episode data across different sources.
@@ -11,19 +19,25 @@ def normalize_episodes(episodes: List[Episode]) -> List[Episode]:
     Cleans up text fields, ensures consistent formatting, and
     removes duplicates within the same source.
     """
-    normalized = []
+    candidates = []
     seen_ids = set()
 
     for episode in episodes:
         if episode.id in seen_ids:
             continue
         seen_ids.add(episode.id)
+        candidates.append(episode)
 
-        normalized_episode = _normalize_episode(episode)
-        if normalized_episode:
-            normalized.append(normalized_episode)
+    if len(candidates) < PARALLEL_THRESHOLD:
+        results = map(_normalize_episode, candidates)
+    else:
+        # Text cleaning is CPU-bound, so spread large batches across cores
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(
+                _normalize_episode, candidates, chunksize=PARALLEL_CHUNK_SIZE
+            ))
 
-    return normalized
+    return [episode for episode in results if episode]
 
 
 def _normalize_episode(episode: Episode) -> Optional[Episode]:
@@ -43,12 +57,23 @@ def _normalize_episode(episode: Episode) -> Optional[Episode]:
         description = clean_text(episode.description or "")
         description = truncate_text(description, max_length=500)
 
+        podcast_author = clean_text(episode.podcast_author) if episode.podcast_author else None
+
+        # Already-clean episodes are returned as-is
+        if (
+            title == episode.title
+            and podcast_title == episode.podcast_title
+            and description == episode.description
+            and podcast_author == episode.podcast_author
+        ):
+            return episode
+
         # Create normalized copy
         return Episode(
             id=episode.id,
             title=title,
             podcast_title=podcast_title,
-            podcast_author=clean_text(episode.podcast_author) if episode.podcast_author else None,
+            podcast_author=podcast_author,
             description=description,
             summary=episode.summary,
             published_at=episode.published_at,
@@ -69,19 +94,8 @@ def clean_text(text: Optional[str]) -> str:
     if not text:
         return ""
 
-    # Decode HTML entities
-    text = html.unescape(text)
-
-    # Remove HTML tags
-    text = re.sub(r"<[^>]+>", " ", text)
-
-    # Remove excessive whitespace
-    text = re.sub(r"\s+", " ", text)
-
-    # Remove leading/trailing whitespace
-    text = text.strip()
-
-    return text
+    # Decode HTML entities, then strip tags and excess whitespace in one pass
+    return _CLEAN_RE.sub(" ", html.unescape(text)).strip()
 
 
 def truncate_text(text: str, max_length: int = 500) -> str: